@@ -1,13 +1,29 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, RedirectResponse
+from brotli_asgi import BrotliMiddleware
 from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from typing import Optional, List, Dict, Callable, Awaitable, Any
 from datetime import datetime, timedelta
+from contextlib import asynccontextmanager, suppress
+from collections import OrderedDict
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorGridFSBucket
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from gridfs.errors import NoFile
+import asyncio
+import csv
+import hashlib
+import io
+import logging
 import os
+import re
+import socket
+import tempfile
+import time
 from dotenv import load_dotenv
 import uuid
 
@@ -18,9 +34,50 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017/rwanda_cooperatives")
+# Responses smaller than this (in bytes) are sent uncompressed
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "500"))
+# Background jobs run in every worker; the Mongo lease makes sure only one executes each run
+JOB_SCHEDULER_ENABLED = os.getenv("JOB_SCHEDULER_ENABLED", "true").lower() == "true"
+# Longest a job may run; its lease is held at least this long so no other worker starts it
+JOB_TIMEOUT_SECONDS = int(os.getenv("JOB_TIMEOUT_SECONDS", "600"))
+WORKER_ID = os.getenv("WORKER_ID", f"{socket.gethostname()}-{os.getpid()}")
+# District report snapshots are stored on local disk ("disk") or in GridFS ("gridfs").
+# With disk storage each host keeps its own copy and rebuilds blobs it is missing.
+REPORT_STORAGE = os.getenv("REPORT_STORAGE", "disk")
+REPORTS_DIR = os.getenv("REPORTS_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "report_blobs"))
+REPORT_REFRESH_SECONDS = int(os.getenv("REPORT_REFRESH_SECONDS", "900"))
+# Blobs no snapshot references are deleted once they are older than the grace period
+REPORT_CLEANUP_SECONDS = int(os.getenv("REPORT_CLEANUP_SECONDS", "3600"))
+REPORT_BLOB_GRACE_SECONDS = int(os.getenv("REPORT_BLOB_GRACE_SECONDS", "3600"))
+# Seconds between attempts to reach Mongo while the worker is warming up
+WARMUP_RETRY_SECONDS = float(os.getenv("WARMUP_RETRY_SECONDS", "2"))
+# Per-worker cooperative cache; the TTL bounds staleness from writes made by other workers
+COOPERATIVE_CACHE_SIZE = int(os.getenv("COOPERATIVE_CACHE_SIZE", "1000"))
+COOPERATIVE_CACHE_TTL = float(os.getenv("COOPERATIVE_CACHE_TTL", "60"))
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    connect_database()
+    # Warm up in the background so the worker can accept requests immediately
+    warmup = asyncio.create_task(warm_dependencies())
+    if JOB_SCHEDULER_ENABLED:
+        scheduler.start()
+    yield
+    warmup.cancel()
+    # Let an in-flight ping finish cancelling before the client is closed
+    with suppress(asyncio.CancelledError):
+        await warmup
+    await scheduler.stop()
+    close_database()
 
 # FastAPI app
-app = FastAPI(title="Rwanda District Cooperative Management System", version="1.0.0")
+app = FastAPI(
+    title="Rwanda District Cooperative Management System",
+    version="1.0.0",
+    lifespan=lifespan,
+)
 
 # CORS middleware
 app.add_middleware(
@@ -31,12 +88,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Database connection
-client = AsyncIOMotorClient(MONGO_URL)
-db = client.rwanda_cooperatives
+# Compression middleware (brotli when the client accepts it, gzip otherwise)
+app.add_middleware(
+    BrotliMiddleware,
+    minimum_size=COMPRESSION_MINIMUM_SIZE,
+    gzip_fallback=True,
+    # Report blobs are served with byte ranges, which must apply to the stored bytes
+    excluded_handlers=[r"^/api/reports/blobs/"],
+)
+
+# Database connection (created by the lifespan, not at import time)
+client: Optional[AsyncIOMotorClient] = None
+db = None
 
 # Security
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_pwd_context = None
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 # Pydantic models
@@ -98,12 +164,153 @@ class CooperativeCreate(BaseModel):
     village: str
     leader_id: str
 
+# Fields that can be requested through the `fields` query parameter
+COOPERATIVE_FIELDS = set(Cooperative.model_fields)
+
+# Dependency initialisation
+readiness = {"database": False, "crypto": False}
+
+def connect_database():
+    global client, db
+    if client is None:
+        # Motor connects lazily, so this does not block on Mongo being reachable
+        client = AsyncIOMotorClient(MONGO_URL)
+        db = client.rwanda_cooperatives
+
+def close_database():
+    global client, db
+    if client is not None:
+        client.close()
+    client = None
+    db = None
+    readiness["database"] = False
+    cooperative_cache.clear()
+
+def get_pwd_context():
+    """Build the bcrypt context on first use; passlib is only imported then."""
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _pwd_context
+
+async def ensure_indexes():
+    # Report downloads look up the owning snapshot by blob name
+    await db.report_snapshots.create_index("blobs.csv")
+    await db.report_snapshots.create_index("blobs.pdf")
+    # Report freshness checks sum a district's monthly change counters
+    await db.data_versions.create_index([("district", 1), ("period", 1)])
+
+async def warm_dependencies():
+    """Load the bcrypt backend and wait for Mongo, recording each in `readiness`."""
+    # The first hash loads and self-tests the bcrypt backend, which takes a while
+    try:
+        await asyncio.to_thread(get_pwd_context().hash, "warmup")
+        readiness["crypto"] = True
+    except Exception:
+        # A broken bcrypt install will not fix itself, so report it once and stay unready
+        logger.exception("Could not load the bcrypt backend; /api/ready will report crypto as unavailable")
+    
+    while not readiness["database"]:
+        try:
+            await client.admin.command("ping")
+            await ensure_indexes()
+            readiness["database"] = True
+        except Exception as exc:
+            logger.warning("Database not reachable yet: %s", exc)
+            await asyncio.sleep(WARMUP_RETRY_SECONDS)
+
+# Caching
+class ReadThroughCache:
+    """Bounded LRU cache that loads missing keys with `loader`.
+
+    Concurrent misses for the same key share a single load. Entries expire after
+    `ttl` seconds and are dropped early by `invalidate`. Loads returning None are
+    not cached.
+    """
+
+    def __init__(self, loader: Callable[[Any], Awaitable[Any]], max_size: int, ttl: float):
+        self.loader = loader
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._inflight: Dict[Any, asyncio.Task] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "loads": 0}
+
+    async def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return value
+            del self._entries[key]
+        
+        self.stats["misses"] += 1
+        task = self._inflight.get(key)
+        if task is None:
+            # Load in a separate task so a cancelled caller does not abort it for the others
+            task = asyncio.create_task(self._load(key))
+            self._inflight[key] = task
+            self.stats["loads"] += 1
+        else:
+            self.stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    async def _load(self, key):
+        try:
+            value = await self.loader(key)
+        finally:
+            # invalidate() drops the in-flight task when the document changes mid-load
+            current = self._inflight.get(key) is asyncio.current_task()
+            if current:
+                del self._inflight[key]
+        
+        if value is not None and current:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, key):
+        self._entries.pop(key, None)
+        # Later readers start a fresh load instead of joining one that may be stale
+        self._inflight.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+        self._inflight.clear()
+
+async def load_cooperative(cooperative_id: str) -> Optional[dict]:
+    return await db.cooperatives.find_one({"id": cooperative_id}, {"_id": 0})
+
+cooperative_cache = ReadThroughCache(load_cooperative, COOPERATIVE_CACHE_SIZE, COOPERATIVE_CACHE_TTL)
+
 # Utility functions
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
+
+def parse_fields(fields: Optional[str], allowed: set) -> Optional[dict]:
+    """Turn a comma-separated `fields` parameter into a Mongo projection."""
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - allowed
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    # Always return the id so clients can address the record
+    requested.add("id")
+    projection = {field: 1 for field in requested}
+    projection["_id"] = 0
+    return projection
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -134,11 +341,604 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         raise credentials_exception
     return User(**user)
 
+# Background jobs
+class IntervalTrigger:
+    """Fire every `seconds` seconds."""
+
+    def __init__(self, seconds: int):
+        self.seconds = seconds
+
+    def next_run(self, after: datetime) -> datetime:
+        return after + timedelta(seconds=self.seconds)
+
+class CronTrigger:
+    """Fire on a five-field cron expression: minute hour day month weekday (UTC).
+
+    Each field accepts `*`, numbers, ranges (`1-5`), lists (`1,15`) and steps (`*/10`).
+    Weekdays run from 0 (Sunday) to 6 (Saturday).
+    """
+
+    RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = [
+            self._parse_field(part, low, high) for part, (low, high) in zip(parts, self.RANGES)
+        ]
+        # Like cron, a restricted day and weekday match if either one does
+        self.day_or_weekday = parts[2] != "*" and parts[4] != "*"
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> set:
+        values = set()
+        for item in field.split(","):
+            base, _, step = item.partition("/")
+            if base == "*":
+                start, end = low, high
+            elif "-" in base:
+                start, end = (int(v) for v in base.split("-", 1))
+            else:
+                start = int(base)
+                end = high if step else start
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field {field!r} is out of range {low}-{high}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_match = moment.day in self.days
+        weekday_match = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.day_or_weekday:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    def next_run(self, after: datetime) -> datetime:
+        candidate = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # Four years covers every valid expression, including Feb 29
+        limit = candidate + timedelta(days=366 * 4)
+        # Skip whole months, days and hours that cannot match before looking at minutes
+        while candidate < limit:
+            if candidate.month not in self.months:
+                month_start = candidate.replace(day=1, hour=0, minute=0)
+                candidate = (month_start + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            else:
+                minute = min((m for m in self.minutes if m >= candidate.minute), default=None)
+                if minute is not None:
+                    return candidate.replace(minute=minute)
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+class JobStats(BaseModel):
+    name: str
+    trigger: str
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    last_run_at: Optional[datetime] = None
+    last_duration_ms: Optional[float] = None
+    max_duration_ms: float = 0.0
+    total_duration_ms: float = 0.0
+    last_error: Optional[str] = None
+    next_run_at: Optional[datetime] = None
+
+class JobScheduler:
+    """In-process async scheduler with a single-runner lease per job stored in Mongo.
+
+    Every worker schedules every job, but before a run the worker must take the
+    job's lease in `db.job_leases`. The lease covers the run itself (up to the
+    job's timeout) and, once the run finishes, lasts until the job's next run
+    time, so other workers skip runs that have already been claimed.
+    """
+
+    def __init__(self, worker_id: str):
+        self.worker_id = worker_id
+        self.jobs: Dict[str, tuple] = {}
+        self.stats: Dict[str, JobStats] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def job(
+        self,
+        name: str,
+        seconds: Optional[int] = None,
+        cron: Optional[str] = None,
+        timeout: int = JOB_TIMEOUT_SECONDS,
+    ):
+        """Register a coroutine function to run on an interval or cron schedule."""
+        if (seconds is None) == (cron is None):
+            raise ValueError("Specify exactly one of seconds or cron")
+        trigger = IntervalTrigger(seconds) if seconds is not None else CronTrigger(cron)
+        # Fail at registration for expressions that never fire, e.g. "0 0 30 2 *"
+        trigger.next_run(datetime.utcnow())
+
+        def decorator(func: Callable[[], Awaitable[None]]):
+            self.jobs[name] = (trigger, func, timeout)
+            self.stats[name] = JobStats(
+                name=name,
+                trigger=f"every {seconds}s" if seconds is not None else f"cron {cron}",
+            )
+            return func
+        return decorator
+
+    def start(self):
+        for name in self.jobs:
+            self._tasks.append(asyncio.create_task(self._loop(name)))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def acquire_lease(self, name: str, until: datetime) -> bool:
+        now = datetime.utcnow()
+        try:
+            lease = await db.job_leases.find_one_and_update(
+                {"_id": name, "$or": [{"expires_at": {"$lte": now}}, {"owner": self.worker_id}]},
+                {"$set": {"owner": self.worker_id, "acquired_at": now, "expires_at": until}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # Another worker holds an unexpired lease, so the upsert collided with it
+            return False
+        return lease is not None and lease["owner"] == self.worker_id
+
+    async def release_lease(self, name: str, until: datetime):
+        """Shorten a held lease to `until` once this worker has finished the run."""
+        await db.job_leases.update_one(
+            {"_id": name, "owner": self.worker_id},
+            {"$set": {"expires_at": until}},
+        )
+
+    async def run_job(self, name: str):
+        """Run a job once in this worker and record its duration."""
+        _, func, timeout = self.jobs[name]
+        stats = self.stats[name]
+        stats.last_run_at = datetime.utcnow()
+        started = time.perf_counter()
+        try:
+            # The lease only covers `timeout` seconds, so stop before another worker can start
+            await asyncio.wait_for(func(), timeout)
+            stats.last_error = None
+        except Exception as exc:
+            stats.failures += 1
+            stats.last_error = repr(exc)
+            logger.exception("Background job %s failed", name)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            stats.runs += 1
+            stats.last_duration_ms = duration_ms
+            stats.total_duration_ms += duration_ms
+            stats.max_duration_ms = max(stats.max_duration_ms, duration_ms)
+            logger.info("Background job %s finished in %.1f ms", name, duration_ms)
+
+    async def _loop(self, name: str):
+        try:
+            await self._schedule(name)
+        except Exception as exc:
+            # Otherwise the task would die silently until its result is gathered at shutdown
+            stats = self.stats[name]
+            stats.last_error = repr(exc)
+            stats.next_run_at = None
+            logger.exception("Scheduling stopped for background job %s", name)
+
+    async def _schedule(self, name: str):
+        trigger, _, timeout = self.jobs[name]
+        stats = self.stats[name]
+        next_run = trigger.next_run(datetime.utcnow())
+        while True:
+            stats.next_run_at = next_run
+            await asyncio.sleep(max((next_run - datetime.utcnow()).total_seconds(), 0))
+            following = trigger.next_run(next_run)
+            # Hold the lease for the whole run even if it overruns the next scheduled time
+            until = max(following, datetime.utcnow() + timedelta(seconds=timeout))
+            try:
+                acquired = await self.acquire_lease(name, until)
+            except Exception:
+                logger.exception("Could not acquire lease for background job %s", name)
+                acquired = False
+            if acquired:
+                await self.run_job(name)
+                try:
+                    await self.release_lease(name, following)
+                except Exception:
+                    logger.exception("Could not release lease for background job %s", name)
+            else:
+                stats.skipped += 1
+            # Skip runs missed while the job was executing instead of bursting through them
+            now = datetime.utcnow()
+            next_run = following if following > now else trigger.next_run(now)
+
+scheduler = JobScheduler(WORKER_ID)
+
+# District reports
+REPORT_MEDIA_TYPES = {"csv": "text/csv", "pdf": "application/pdf"}
+REPORT_CSV_HEADER = ["district", "period", "status", "sector", "cooperatives", "members", "created_in_period"]
+BLOB_NAME_PATTERN = re.compile(r"^[0-9a-f]{64}\.(csv|pdf)$")
+# Blob names are content hashes, so a cached copy can never go stale
+BLOB_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+class ReportSnapshot(BaseModel):
+    district: str
+    period: str
+    data_version: int
+    generated_at: datetime
+    csv_url: str
+    pdf_url: str
+
+class DiskBlobStore:
+    """Content-addressed blobs stored as files under `directory`."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _write(self, name: str, data: bytes):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, name)
+        if os.path.exists(path):
+            return
+        # Write to a unique temporary file first so readers never see a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Another writer storing the same content got there first
+            if not os.path.exists(path):
+                raise
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _read(self, name: str) -> Optional[bytes]:
+        try:
+            with open(os.path.join(self.directory, name), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    async def put(self, name: str, data: bytes):
+        await asyncio.to_thread(self._write, name, data)
+
+    def _list(self) -> List[tuple]:
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return []
+        # Leftover temporary files from interrupted writes are listed too
+        return [
+            (entry.name, datetime.utcfromtimestamp(entry.stat().st_mtime))
+            for entry in entries if entry.is_file()
+        ]
+
+    def _delete(self, name: str):
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+
+    async def get(self, name: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self._read, name)
+
+    async def list(self) -> List[tuple]:
+        """Return (name, created_at) for every stored blob."""
+        return await asyncio.to_thread(self._list)
+
+    async def delete(self, name: str):
+        await asyncio.to_thread(self._delete, name)
+
+class GridFSBlobStore:
+    """Content-addressed blobs stored in a GridFS bucket."""
+
+    def __init__(self, bucket_name: str = "report_blobs"):
+        self.bucket_name = bucket_name
+
+    @property
+    def bucket(self):
+        return AsyncIOMotorGridFSBucket(db, bucket_name=self.bucket_name)
+
+    async def put(self, name: str, data: bytes):
+        if await db[f"{self.bucket_name}.files"].find_one({"filename": name}, {"_id": 1}):
+            return
+        await self.bucket.upload_from_stream(name, data)
+
+    async def get(self, name: str) -> Optional[bytes]:
+        try:
+            stream = await self.bucket.open_download_stream_by_name(name)
+        except NoFile:
+            return None
+        return await stream.read()
+
+    async def list(self) -> List[tuple]:
+        """Return (name, created_at) for every stored blob."""
+        files = db[f"{self.bucket_name}.files"].find({}, {"filename": 1, "uploadDate": 1})
+        return [(f["filename"], f["uploadDate"]) async for f in files]
+
+    async def delete(self, name: str):
+        async for f in db[f"{self.bucket_name}.files"].find({"filename": name}, {"_id": 1}):
+            try:
+                await self.bucket.delete(f["_id"])
+            except NoFile:
+                pass
+
+report_store = GridFSBlobStore() if REPORT_STORAGE == "gridfs" else DiskBlobStore(REPORTS_DIR)
+
+def parse_period(period: str) -> tuple:
+    """Return the [start, end) datetimes of a YYYY-MM period."""
+    try:
+        start = datetime.strptime(period, "%Y-%m")
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Period must be formatted as YYYY-MM"
+        )
+    end = start.replace(year=start.year + 1, month=1) if start.month == 12 else start.replace(month=start.month + 1)
+    return start, end
+
+def check_report_access(current_user: User, district: str):
+    # Only district officials can view district reports, and only for their own district
+    if current_user.role != UserRole.DISTRICT_OFFICIAL or (
+        current_user.district and current_user.district != district
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view reports for this district"
+        )
+
+async def bump_data_version(district: str, changed_at: datetime):
+    """Record a change to a district's cooperatives made at `changed_at`.
+
+    Counters are kept per month: a change only affects reports for the month it
+    was made in and later months, so closed months are not rebuilt.
+    """
+    period = changed_at.strftime("%Y-%m")
+    await db.data_versions.update_one(
+        {"_id": f"{district}:{period}"},
+        {"$inc": {"version": 1}, "$setOnInsert": {"district": district, "period": period}},
+        upsert=True,
+    )
+
+async def get_data_version(district: str, period: str) -> int:
+    """Sum the change counters of every month up to and including `period`."""
+    versions = db.data_versions.find({"district": district, "period": {"$lte": period}}, {"version": 1})
+    return sum([version["version"] async for version in versions])
+
+async def summarize_cooperatives(district: str, period: str) -> List[dict]:
+    """Count cooperatives registered by the end of the period, by status and sector.
+
+    Status is taken as of the end of the period, so later approvals do not change
+    the report for a closed month.
+    """
+    start, end = parse_period(period)
+    status_at_end = {"$cond": [
+        {"$and": [{"$eq": ["$status", "approved"]}, {"$gte": ["$approved_at", end]}]},
+        "pending",
+        "$status",
+    ]}
+    pipeline = [
+        {"$match": {"district": district, "created_at": {"$lt": end}}},
+        {"$group": {
+            "_id": {"status": status_at_end, "sector": "$sector"},
+            "cooperatives": {"$sum": 1},
+            "members": {"$sum": "$members_count"},
+            "created_in_period": {"$sum": {"$cond": [{"$gte": ["$created_at", start]}, 1, 0]}},
+        }},
+        {"$sort": {"_id.status": 1, "_id.sector": 1}},
+    ]
+    groups = await db.cooperatives.aggregate(pipeline).to_list(None)
+    return [
+        {
+            "district": district,
+            "period": period,
+            "status": group["_id"]["status"],
+            "sector": group["_id"]["sector"],
+            "cooperatives": group["cooperatives"],
+            "members": group["members"],
+            "created_in_period": group["created_in_period"],
+        }
+        for group in groups
+    ]
+
+def render_report_csv(rows: List[dict]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=REPORT_CSV_HEADER)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+def render_pdf(lines: List[str], lines_per_page: int = 50) -> bytes:
+    """Render plain text lines as a minimal A4 PDF using the built-in Courier font."""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    # Objects 1-3 are the catalog, page tree and font; each page adds a page and a content stream
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{pid} 0 R' for pid in page_ids)}] /Count {len(pages)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>",
+    ]
+    for page_id, page_lines in zip(page_ids, pages):
+        text = "".join(
+            "({}) Tj T*\n".format(line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)"))
+            for line in page_lines
+        )
+        stream = f"BT /F1 10 Tf 14 TL 40 800 Td\n{text}ET".encode("latin-1", "replace")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(pdf)
+
+def render_report_pdf(district: str, period: str, rows: List[dict]) -> bytes:
+    lines = [
+        f"Cooperative summary - {district} district - {period}",
+        "",
+        f"{'Status':<10} {'Sector':<20} {'Coops':>6} {'Members':>8} {'New':>5}",
+    ]
+    lines += [
+        f"{row['status']:<10} {row['sector'][:20]:<20} {row['cooperatives']:>6} {row['members']:>8} {row['created_in_period']:>5}"
+        for row in rows
+    ]
+    lines += [
+        "",
+        f"Total cooperatives: {sum(row['cooperatives'] for row in rows)}",
+        f"Total members: {sum(row['members'] for row in rows)}",
+    ]
+    return render_pdf(lines)
+
+async def store_blob(data: bytes, extension: str) -> str:
+    name = f"{hashlib.sha256(data).hexdigest()}.{extension}"
+    await report_store.put(name, data)
+    return name
+
+async def build_report_snapshot(district: str, period: str) -> dict:
+    # Read the version first so changes made while building trigger another rebuild
+    data_version = await get_data_version(district, period)
+    rows = await summarize_cooperatives(district, period)
+    snapshot = {
+        "_id": f"{district}:{period}",
+        "district": district,
+        "period": period,
+        "data_version": data_version,
+        "generated_at": datetime.utcnow(),
+        "blobs": {
+            "csv": await store_blob(render_report_csv(rows), "csv"),
+            "pdf": await store_blob(render_report_pdf(district, period, rows), "pdf"),
+        },
+    }
+    await db.report_snapshots.replace_one({"_id": snapshot["_id"]}, snapshot, upsert=True)
+    return snapshot
+
+async def load_report_snapshot(snapshot_id: str) -> dict:
+    """Return the stored snapshot, rebuilding it only if the period's data changed."""
+    district, _, period = snapshot_id.rpartition(":")
+    snapshot = await db.report_snapshots.find_one({"_id": snapshot_id})
+    if snapshot is None or snapshot["data_version"] != await get_data_version(district, period):
+        snapshot = await build_report_snapshot(district, period)
+    return snapshot
+
+# Coalesces concurrent lookups of one snapshot; nothing is kept once a lookup finishes
+report_snapshot_loads = ReadThroughCache(load_report_snapshot, max_size=0, ttl=0)
+
+async def get_report_snapshot(district: str, period: str) -> dict:
+    return await report_snapshot_loads.get(f"{district}:{period}")
+
+async def rebuild_report_snapshot(snapshot_id: str) -> dict:
+    district, _, period = snapshot_id.rpartition(":")
+    return await build_report_snapshot(district, period)
+
+# Rebuilds snapshots whose blobs are missing from this host's store, one at a time per snapshot
+report_snapshot_rebuilds = ReadThroughCache(rebuild_report_snapshot, max_size=0, ttl=0)
+
+@scheduler.job("district_reports", seconds=REPORT_REFRESH_SECONDS)
+async def refresh_district_reports():
+    """Keep the current month's report snapshots warm for every district."""
+    period = datetime.utcnow().strftime("%Y-%m")
+    for district in await db.data_versions.distinct("district"):
+        await get_report_snapshot(district, period)
+
+# Disk blobs are local to each host, so every host needs its own cleanup lease
+REPORT_CLEANUP_JOB = "report_blob_cleanup" if REPORT_STORAGE == "gridfs" else f"report_blob_cleanup:{socket.gethostname()}"
+
+@scheduler.job(REPORT_CLEANUP_JOB, seconds=REPORT_CLEANUP_SECONDS)
+async def cleanup_report_blobs():
+    """Delete blobs left behind when snapshots were rebuilt."""
+    referenced = set()
+    async for snapshot in db.report_snapshots.find({}, {"blobs": 1}):
+        referenced.update(snapshot["blobs"].values())
+    # Skip recent blobs: a build stores its blobs before saving the snapshot that references them
+    cutoff = datetime.utcnow() - timedelta(seconds=REPORT_BLOB_GRACE_SECONDS)
+    for name, created_at in await report_store.list():
+        if name not in referenced and created_at < cutoff:
+            await report_store.delete(name)
+
+def parse_byte_range(header: str, size: int) -> Optional[tuple]:
+    """Parse a single `bytes=` range into inclusive (start, end) offsets.
+
+    Returns None when the header should be ignored (RFC 7233 says invalid ranges
+    are ignored) and raises ValueError when the range cannot be satisfied.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        # Multiple ranges are optional for servers; send the whole blob instead
+        return None
+    first, _, last = spec.strip().partition("-")
+    if (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+    if not first:
+        if not last:
+            return None
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError("Range not satisfiable")
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+def blob_response(request: Request, data: bytes, media_type: str, etag: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": BLOB_CACHE_CONTROL, "Accept-Ranges": "bytes"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    range_header = request.headers.get("range")
+    # If-Range asks for the full blob unless the client's copy is still current
+    if range_header and request.headers.get("if-range", etag) == etag:
+        try:
+            byte_range = parse_byte_range(range_header, len(data))
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{len(data)}"},
+            )
+        if byte_range:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+            return Response(
+                content=data[start:end + 1],
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers=headers,
+            )
+    
+    return Response(content=data, media_type=media_type, headers=headers)
+
 # Routes
 @app.get("/api/health")
 async def health_check():
     return {"status": "healthy", "message": "Rwanda Cooperative Management System API"}
 
+@app.get("/api/ready")
+async def readiness_check():
+    # Unlike /api/health this fails until the worker's dependencies are warm
+    ready = all(readiness.values())
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "ready" if ready else "starting", "dependencies": readiness},
+    )
+
 @app.post("/api/auth/register", response_model=Token)
 async def register_user(user: UserCreate):
     # Check if user already exists
@@ -228,6 +1028,8 @@ async def create_cooperative(
     }
     
     await db.cooperatives.insert_one(cooperative_data)
+    await bump_data_version(cooperative.district, cooperative_data["created_at"])
+    cooperative_cache.invalidate(cooperative_id)
     
     return Cooperative(**cooperative_data)
 
@@ -235,8 +1037,10 @@ async def create_cooperative(
 async def get_cooperatives(
     district: Optional[str] = None,
     status: Optional[str] = None,
+    fields: Optional[str] = None,
     current_user: User = Depends(get_current_user)
 ):
+    projection = parse_fields(fields, COOPERATIVE_FIELDS)
     query = {}
     
     # Filter based on user role
@@ -251,9 +1055,37 @@ async def get_cooperatives(
     if status:
         query["status"] = status
     
+    # Sparse fieldsets skip model validation since required fields may be absent
+    if projection:
+        cooperatives = await db.cooperatives.find(query, projection).to_list(100)
+        return JSONResponse(content=jsonable_encoder(cooperatives))
+    
     cooperatives = await db.cooperatives.find(query).to_list(100)
     return [Cooperative(**coop) for coop in cooperatives]
 
+@app.get("/api/cooperatives/{cooperative_id}", response_model=Cooperative)
+async def get_cooperative(
+    cooperative_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    cooperative = await cooperative_cache.get(cooperative_id)
+    
+    # Apply the same role-based filtering as the cooperative listing
+    if cooperative and current_user.role == UserRole.DISTRICT_OFFICIAL and current_user.district:
+        if cooperative["district"] != current_user.district:
+            cooperative = None
+    elif cooperative and current_user.role == UserRole.COOPERATIVE_LEADER and current_user.cooperative_id:
+        if cooperative["id"] != current_user.cooperative_id:
+            cooperative = None
+    
+    if not cooperative:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cooperative not found"
+        )
+    
+    return Cooperative(**cooperative)
+
 @app.put("/api/cooperatives/{cooperative_id}/approve")
 async def approve_cooperative(
     cooperative_id: str,
@@ -266,7 +1098,7 @@ async def approve_cooperative(
             detail="Not authorized to approve cooperatives"
         )
     
-    cooperative = await db.cooperatives.find_one({"id": cooperative_id})
+    cooperative = await cooperative_cache.get(cooperative_id)
     if not cooperative:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -274,7 +1106,8 @@ async def approve_cooperative(
         )
     
     # Generate registration number
-    registration_number = f"RW-{cooperative['district'][:3].upper()}-{datetime.utcnow().year}-{cooperative_id[:8].upper()}"
+    approved_at = datetime.utcnow()
+    registration_number = f"RW-{cooperative['district'][:3].upper()}-{approved_at.year}-{cooperative_id[:8].upper()}"
     
     await db.cooperatives.update_one(
         {"id": cooperative_id},
@@ -282,14 +1115,88 @@ async def approve_cooperative(
             "$set": {
                 "status": "approved",
                 "registration_number": registration_number,
-                "approved_at": datetime.utcnow(),
+                "approved_at": approved_at,
                 "approved_by": current_user.id
             }
         }
     )
+    await bump_data_version(cooperative["district"], approved_at)
+    cooperative_cache.invalidate(cooperative_id)
     
     return {"message": "Cooperative approved successfully", "registration_number": registration_number}
 
+@app.get("/api/reports/blobs/{name}")
+async def get_report_blob(
+    name: str,
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    if current_user.role != UserRole.DISTRICT_OFFICIAL:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to download reports"
+        )
+    
+    match = BLOB_NAME_PATTERN.match(name)
+    # Blob names are guessable content hashes, so check the district of the owning snapshot
+    snapshot = await db.report_snapshots.find_one(
+        {"$or": [{"blobs.csv": name}, {"blobs.pdf": name}]},
+        {"district": 1},
+    ) if match else None
+    if snapshot is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report not found"
+        )
+    check_report_access(current_user, snapshot["district"])
+    
+    data = await report_store.get(name)
+    if data is None:
+        # The snapshot was built on another host (disk storage) or its blob was lost
+        snapshot = await report_snapshot_rebuilds.get(snapshot["_id"])
+        rebuilt_name = snapshot["blobs"][match.group(1)]
+        if rebuilt_name != name:
+            # The data changed since this link was issued; point at the current blob
+            return RedirectResponse(
+                url=f"/api/reports/blobs/{rebuilt_name}",
+                status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+            )
+        data = await report_store.get(name)
+    
+    return blob_response(request, data, REPORT_MEDIA_TYPES[match.group(1)], f'"{name.split(".")[0]}"')
+
+@app.get("/api/reports/{district}/{period}", response_model=ReportSnapshot)
+async def get_district_report(
+    district: str,
+    period: str,
+    current_user: User = Depends(get_current_user)
+):
+    check_report_access(current_user, district)
+    # strptime accepts e.g. 2025-1, so normalise before the period becomes a snapshot key
+    start, _ = parse_period(period)
+    period = start.strftime("%Y-%m")
+    snapshot = await get_report_snapshot(district, period)
+    
+    return ReportSnapshot(
+        district=snapshot["district"],
+        period=snapshot["period"],
+        data_version=snapshot["data_version"],
+        generated_at=snapshot["generated_at"],
+        csv_url=f"/api/reports/blobs/{snapshot['blobs']['csv']}",
+        pdf_url=f"/api/reports/blobs/{snapshot['blobs']['pdf']}",
+    )
+
+@app.get("/api/jobs", response_model=List[JobStats])
+async def get_job_stats(current_user: User = Depends(get_current_user)):
+    # Only district officials can inspect background jobs
+    if current_user.role != UserRole.DISTRICT_OFFICIAL:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view background jobs"
+        )
+    
+    return list(scheduler.stats.values())
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
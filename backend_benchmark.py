@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Backend Benchmarks for Rwanda District Cooperative Management System
+Measures payload size and CPU cost of the API's hot paths without a running server
+"""
+
+import asyncio
+import gc
+import gzip
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+from datetime import datetime
+
+import brotli
+
+# Typical list sizes served to district officials (the API caps lists at 100)
+LIST_SIZES = [10, 50, 100]
+
+# Same levels the compression middleware uses
+BROTLI_QUALITY = 4
+GZIP_LEVEL = 9
+
+# Repetitions per measurement
+ROUNDS = 200
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
+# Cold starts measured per run, and how long to wait for a worker before giving up
+STARTUP_RUNS = 3
+STARTUP_TIMEOUT = 30
+
+# Hot-key access pattern for the cooperative detail endpoint
+CACHE_REQUESTS = 2000
+CACHE_CONCURRENCY = 50
+CACHE_KEYS = 500
+CACHE_HOT_KEYS = 5
+CACHE_HOT_SHARE = 0.9
+# Simulated Mongo round trip in seconds
+DB_LATENCY = 0.002
+
+def make_cooperative(index):
+    """Build a cooperative document shaped like the ones stored in Mongo"""
+    return {
+        'id': str(uuid.uuid4()),
+        'name': f'Cooperative {index}',
+        'registration_number': None,
+        'description': (
+            'Agricultural cooperative focused on coffee production and processing, '
+            'serving smallholder farmers with shared washing stations, training on '
+            'post-harvest handling and collective access to export markets.'
+        ),
+        'district': 'Kigali',
+        'sector': 'Gasabo',
+        'cell': 'Kimisagara',
+        'village': 'Nyamirambo',
+        'leader_id': str(uuid.uuid4()),
+        'members_count': index,
+        'status': 'pending',
+        'created_at': datetime.utcnow().isoformat(),
+        'approved_at': None,
+        'approved_by': None,
+    }
+
+def cpu_per_call(func, payload):
+    """Return (result, CPU microseconds per call) for func(payload)"""
+    start = time.process_time()
+    for _ in range(ROUNDS):
+        result = func(payload)
+    elapsed = time.process_time() - start
+    return result, elapsed / ROUNDS * 1_000_000
+
+def bench_compression():
+    """Report bytes on the wire and CPU per request for full and sparse lists"""
+    print("📦 Response compression and sparse fieldsets")
+    print(f"{'items':>6} {'fields':>8} {'encoding':>9} {'bytes':>9} {'cpu µs':>9}")
+
+    for size in LIST_SIZES:
+        cooperatives = [make_cooperative(i) for i in range(size)]
+        variants = {
+            'all': cooperatives,
+            'sparse': [{'id': c['id'], 'name': c['name'], 'status': c['status']} for c in cooperatives],
+        }
+        for fields, documents in variants.items():
+            body, serialize_us = cpu_per_call(lambda d: json.dumps(d).encode(), documents)
+            encoders = {
+                'identity': lambda b: b,
+                'gzip': lambda b: gzip.compress(b, compresslevel=GZIP_LEVEL),
+                'br': lambda b: brotli.compress(b, quality=BROTLI_QUALITY),
+            }
+            for encoding, encode in encoders.items():
+                wire, encode_us = cpu_per_call(encode, body)
+                print(f"{size:>6} {fields:>8} {encoding:>9} {len(wire):>9} {serialize_us + encode_us:>9.1f}")
+    print()
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def wait_for(url, deadline):
+    """Poll url until it answers 200 and return the time it did, or None on timeout"""
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter()
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(0.01)
+    return None
+
+def bench_startup():
+    """Report import time, time-to-first-request and time until dependencies are warm"""
+    print("⏱️  Startup time")
+    print(f"{'run':>4} {'import s':>9} {'first request s':>16} {'ready s':>8}")
+
+    for run in range(1, STARTUP_RUNS + 1):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'import server'], cwd=BACKEND_DIR, check=True)
+        import_time = time.perf_counter() - start
+
+        port = free_port()
+        start = time.perf_counter()
+        worker = subprocess.Popen(
+            [sys.executable, '-m', 'uvicorn', 'server:app', '--port', str(port), '--log-level', 'warning'],
+            cwd=BACKEND_DIR,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = start + STARTUP_TIMEOUT
+            first_request = wait_for(f'http://127.0.0.1:{port}/api/health', deadline)
+            ready = wait_for(f'http://127.0.0.1:{port}/api/ready', deadline)
+        finally:
+            worker.terminate()
+            worker.wait()
+
+        first_request = f"{first_request - start:.3f}" if first_request else 'timeout'
+        # Readiness needs a reachable Mongo at MONGO_URL
+        ready = f"{ready - start:.3f}" if ready else 'timeout'
+        print(f"{run:>4} {import_time:>9.3f} {first_request:>16} {ready:>8}")
+    print()
+
+class SimulatedCollection:
+    """Stands in for db.cooperatives, counting find_one queries"""
+
+    def __init__(self, documents):
+        self.documents = {doc['id']: doc for doc in documents}
+        self.queries = 0
+
+    async def find_one(self, query, projection=None):
+        self.queries += 1
+        await asyncio.sleep(DB_LATENCY)
+        return self.documents.get(query['id'])
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+async def run_hot_key_load(fetch, keys):
+    """Issue the requests with bounded concurrency and return per-request latencies"""
+    semaphore = asyncio.Semaphore(CACHE_CONCURRENCY)
+    latencies = []
+
+    async def request(key):
+        async with semaphore:
+            start = time.perf_counter()
+            await fetch(key)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(request(key) for key in keys))
+    return latencies
+
+def bench_cooperative_cache():
+    """Report DB queries and latency for cooperative lookups under a hot-key pattern"""
+    sys.path.insert(0, BACKEND_DIR)
+    import server
+
+    print("🔥 Cooperative detail cache (hot keys)")
+    print(f"{'mode':>8} {'queries':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+
+    cooperatives = [make_cooperative(i) for i in range(CACHE_KEYS)]
+    ids = [coop['id'] for coop in cooperatives]
+    rng = random.Random(42)
+    keys = [
+        rng.choice(ids[:CACHE_HOT_KEYS]) if rng.random() < CACHE_HOT_SHARE else rng.choice(ids)
+        for _ in range(CACHE_REQUESTS)
+    ]
+
+    for mode in ['direct', 'cached']:
+        collection = SimulatedCollection(cooperatives)
+        if mode == 'direct':
+            fetch = lambda key: collection.find_one({'id': key})
+        else:
+            cache = server.ReadThroughCache(
+                lambda key: collection.find_one({'id': key}),
+                server.COOPERATIVE_CACHE_SIZE,
+                server.COOPERATIVE_CACHE_TTL,
+            )
+            fetch = cache.get
+        # Keep garbage collection pauses out of the timings so they reflect the cache itself
+        gc.collect()
+        gc.disable()
+        try:
+            latencies = asyncio.run(run_hot_key_load(fetch, keys))
+        finally:
+            gc.enable()
+        p50, p95, p99 = (percentile(latencies, f) * 1000 for f in (0.5, 0.95, 0.99))
+        print(f"{mode:>8} {collection.queries:>8} {p50:>8.2f} {p95:>8.2f} {p99:>8.2f}")
+    print()
+
+def run_all_benchmarks():
+    """Run all backend benchmarks in sequence"""
+    print("🚀 Starting Rwanda District Cooperative Management System Backend Benchmarks")
+    print("="*60)
+
+    bench_compression()
+    bench_startup()
+    bench_cooperative_cache()
+
+    return True
+
+if __name__ == "__main__":
+    success = run_all_benchmarks()
+    sys.exit(0 if success else 1)
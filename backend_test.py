@@ -5,9 +5,11 @@ Tests all API endpoints, authentication, role-based access control, and data val
 """
 
 import requests
+import asyncio
 import json
+import sys
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 from dotenv import load_dotenv
 
@@ -16,6 +18,8 @@ load_dotenv()
 # Get backend URL from frontend .env file
 BACKEND_URL = os.getenv('REACT_APP_BACKEND_URL', 'http://localhost:8001')
 API_BASE = f"{BACKEND_URL}/api"
+# Scheduler checks import the backend directly and need no running server
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
 
 class TestResults:
     def __init__(self):
@@ -105,6 +109,23 @@ def test_health_check():
         results.log_fail("Health check endpoint", f"Connection error: {str(e)}")
     return False
 
+def test_readiness_check():
+    """Test the readiness endpoint reports warm dependencies"""
+    try:
+        response = requests.get(f"{API_BASE}/ready", timeout=10)
+        if response.status_code == 200:
+            data = response.json()
+            if data.get('status') == 'ready' and all(data.get('dependencies', {}).values()):
+                results.log_pass("Readiness check endpoint")
+                return True
+            else:
+                results.log_fail("Readiness check endpoint", f"Unexpected response: {data}")
+        else:
+            results.log_fail("Readiness check endpoint", f"Status code: {response.status_code}")
+    except Exception as e:
+        results.log_fail("Readiness check endpoint", f"Connection error: {str(e)}")
+    return False
+
 def test_user_registration():
     """Test user registration for all roles"""
     for role, user_data in test_users.items():
@@ -318,6 +339,140 @@ def test_cooperative_listing():
         except Exception as e:
             results.log_fail(f"Cooperative listing - {role}", f"Request error: {str(e)}")
 
+def test_cooperative_detail():
+    """Test fetching a single cooperative and that approval refreshes it"""
+    if 'district_official' not in tokens:
+        results.log_fail("Cooperative detail", "No district official token available")
+        return
+    
+    headers = {'Authorization': f'Bearer {tokens["district_official"]}'}
+    try:
+        response = requests.get(
+            f"{API_BASE}/cooperatives",
+            headers=headers,
+            timeout=10
+        )
+        pending = [coop for coop in response.json() if coop['status'] == 'pending'] if response.status_code == 200 else []
+        if not pending:
+            results.log_fail("Cooperative detail", "No pending cooperative available")
+            return
+        coop_id = pending[0]['id']
+        
+        response = requests.get(
+            f"{API_BASE}/cooperatives/{coop_id}",
+            headers=headers,
+            timeout=10
+        )
+        
+        if response.status_code == 200 and response.json().get('id') == coop_id:
+            results.log_pass("Cooperative detail")
+        else:
+            results.log_fail("Cooperative detail", f"Status code: {response.status_code}")
+            return
+        
+        requests.put(
+            f"{API_BASE}/cooperatives/{coop_id}/approve",
+            headers=headers,
+            timeout=10
+        )
+        response = requests.get(
+            f"{API_BASE}/cooperatives/{coop_id}",
+            headers=headers,
+            timeout=10
+        )
+        
+        if response.status_code == 200 and response.json().get('status') == 'approved':
+            results.log_pass("Cooperative detail - refreshed after approval")
+        else:
+            results.log_fail("Cooperative detail - refreshed after approval", f"Status: {response.json().get('status')}")
+    except Exception as e:
+        results.log_fail("Cooperative detail", f"Request error: {str(e)}")
+    
+    try:
+        response = requests.get(
+            f"{API_BASE}/cooperatives/{uuid.uuid4()}",
+            headers=headers,
+            timeout=10
+        )
+        
+        if response.status_code == 404:
+            results.log_pass("Cooperative detail - unknown ID")
+        else:
+            results.log_fail("Cooperative detail - unknown ID", f"Expected 404, got {response.status_code}")
+    except Exception as e:
+        results.log_fail("Cooperative detail - unknown ID", f"Request error: {str(e)}")
+
+def test_cooperative_sparse_fields():
+    """Test that the fields parameter trims cooperative listings"""
+    if 'district_official' not in tokens:
+        results.log_fail("Cooperative sparse fields", "No district official token available")
+        return
+    
+    headers = {'Authorization': f'Bearer {tokens["district_official"]}'}
+    try:
+        response = requests.get(
+            f"{API_BASE}/cooperatives",
+            params={'fields': 'name,status'},
+            headers=headers,
+            timeout=10
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            if all(set(coop) == {'id', 'name', 'status'} for coop in data):
+                results.log_pass("Cooperative sparse fields")
+            else:
+                results.log_fail("Cooperative sparse fields", f"Unexpected keys: {data[:1]}")
+        else:
+            results.log_fail("Cooperative sparse fields", f"Status code: {response.status_code}")
+    except Exception as e:
+        results.log_fail("Cooperative sparse fields", f"Request error: {str(e)}")
+    
+    try:
+        response = requests.get(
+            f"{API_BASE}/cooperatives",
+            params={'fields': 'name,hashed_password'},
+            headers=headers,
+            timeout=10
+        )
+        
+        if response.status_code == 400:
+            results.log_pass("Cooperative sparse fields - unknown field rejected")
+        else:
+            results.log_fail("Cooperative sparse fields - unknown field rejected", f"Expected 400, got {response.status_code}")
+    except Exception as e:
+        results.log_fail("Cooperative sparse fields - unknown field rejected", f"Request error: {str(e)}")
+
+def test_response_compression():
+    """Test that large responses are compressed when the client accepts it"""
+    if 'district_official' not in tokens:
+        results.log_fail("Response compression", "No district official token available")
+        return
+    
+    for encoding in ['br', 'gzip']:
+        try:
+            headers = {
+                'Authorization': f'Bearer {tokens["district_official"]}',
+                'Accept-Encoding': encoding
+            }
+            response = requests.get(
+                f"{API_BASE}/cooperatives",
+                headers=headers,
+                timeout=10
+            )
+            
+            if response.status_code != 200:
+                results.log_fail(f"Response compression - {encoding}", f"Status code: {response.status_code}")
+            elif len(response.content) < 500:
+                # Below the minimum size the body is sent as-is
+                results.log_pass(f"Response compression - {encoding} (below threshold)")
+            elif response.headers.get('Content-Encoding') == encoding:
+                results.log_pass(f"Response compression - {encoding}")
+            else:
+                results.log_fail(f"Response compression - {encoding}", f"Content-Encoding: {response.headers.get('Content-Encoding')}")
+        except Exception as e:
+            results.log_fail(f"Response compression - {encoding}", f"Request error: {str(e)}")
+
 def test_cooperative_approval():
     """Test cooperative approval by district official"""
     if 'district_official' not in tokens:
@@ -382,6 +537,161 @@ def test_cooperative_approval():
         except Exception as e:
             results.log_fail("Cooperative approval - unauthorized user rejection", f"Request error: {str(e)}")
 
+def test_district_report():
+    """Test district report snapshots and ranged blob downloads"""
+    if 'district_official' not in tokens:
+        results.log_fail("District report", "No district official token available")
+        return
+    
+    headers = {'Authorization': f'Bearer {tokens["district_official"]}'}
+    district = test_users['district_official']['district']
+    period = datetime.utcnow().strftime('%Y-%m')
+    try:
+        response = requests.get(
+            f"{API_BASE}/reports/{district}/{period}",
+            headers=headers,
+            timeout=10
+        )
+        
+        if response.status_code != 200:
+            results.log_fail("District report", f"Status code: {response.status_code}")
+            return
+        snapshot = response.json()
+        results.log_pass("District report")
+        
+        response = requests.get(
+            f"{BACKEND_URL}{snapshot['pdf_url']}",
+            headers={**headers, 'Range': 'bytes=0-7'},
+            timeout=10
+        )
+        
+        if response.status_code == 206 and response.content == b'%PDF-1.4' and 'immutable' in response.headers.get('Cache-Control', ''):
+            results.log_pass("District report - ranged PDF download")
+        else:
+            results.log_fail("District report - ranged PDF download", f"Status code: {response.status_code}")
+        
+        response = requests.get(
+            f"{BACKEND_URL}{snapshot['csv_url']}",
+            headers=headers,
+            timeout=10
+        )
+        
+        if response.status_code == 200 and response.text.startswith('district,period,status,sector'):
+            results.log_pass("District report - CSV download")
+        else:
+            results.log_fail("District report - CSV download", f"Status code: {response.status_code}")
+    except Exception as e:
+        results.log_fail("District report", f"Request error: {str(e)}")
+    
+    if 'member' in tokens:
+        try:
+            response = requests.get(
+                f"{API_BASE}/reports/{district}/{period}",
+                headers={'Authorization': f'Bearer {tokens["member"]}'},
+                timeout=10
+            )
+            
+            if response.status_code == 403:
+                results.log_pass("District report - member access denied")
+            else:
+                results.log_fail("District report - member access denied", f"Expected 403, got {response.status_code}")
+        except Exception as e:
+            results.log_fail("District report - member access denied", f"Request error: {str(e)}")
+
+def test_report_blob_requests():
+    """Test conditional, ranged and cross-district report blob requests"""
+    if 'district_official' not in tokens:
+        results.log_fail("Report blob requests", "No district official token available")
+        return
+    
+    headers = {'Authorization': f'Bearer {tokens["district_official"]}'}
+    district = test_users['district_official']['district']
+    period = datetime.utcnow().strftime('%Y-%m')
+    try:
+        snapshot = requests.get(
+            f"{API_BASE}/reports/{district}/{period}",
+            headers=headers,
+            timeout=10
+        ).json()
+        blob_url = f"{BACKEND_URL}{snapshot['csv_url']}"
+        full = requests.get(blob_url, headers=headers, timeout=10)
+        size = len(full.content)
+        etag = full.headers.get('ETag')
+    except Exception as e:
+        results.log_fail("Report blob requests", f"Request error: {str(e)}")
+        return
+    
+    cases = [
+        ("suffix range", {'Range': 'bytes=-5'}, 206, lambda r: r.content == full.content[-5:]),
+        ("inverted range ignored", {'Range': 'bytes=7-3'}, 200, lambda r: r.content == full.content),
+        ("malformed range ignored", {'Range': 'bytes=a-b'}, 200, lambda r: r.content == full.content),
+        ("unsatisfiable range", {'Range': f'bytes={size}-'}, 416, lambda r: r.headers.get('Content-Range') == f'bytes */{size}'),
+        ("If-None-Match", {'If-None-Match': etag}, 304, lambda r: not r.content),
+    ]
+    for label, extra_headers, expected_status, check in cases:
+        try:
+            response = requests.get(blob_url, headers={**headers, **extra_headers}, timeout=10)
+            if response.status_code != expected_status:
+                results.log_fail(f"Report blob - {label}", f"Expected {expected_status}, got {response.status_code}")
+            elif not check(response):
+                results.log_fail(f"Report blob - {label}", "Unexpected body or headers")
+            else:
+                results.log_pass(f"Report blob - {label}")
+        except Exception as e:
+            results.log_fail(f"Report blob - {label}", f"Request error: {str(e)}")
+    
+    # A blob from another district's report must not be downloadable
+    try:
+        other_official = {
+            'email': f'official.{uuid.uuid4().hex[:8]}@gov.rw',
+            'password': 'SecurePass123!',
+            'full_name': 'Other District Official',
+            'role': 'district_official',
+            'district': 'Huye',
+        }
+        other_token = requests.post(f"{API_BASE}/auth/register", json=other_official, timeout=10).json()['access_token']
+        other_snapshot = requests.get(
+            f"{API_BASE}/reports/Huye/{period}",
+            headers={'Authorization': f'Bearer {other_token}'},
+            timeout=10
+        ).json()
+        response = requests.get(
+            f"{BACKEND_URL}{other_snapshot['csv_url']}",
+            headers=headers,
+            timeout=10
+        )
+        
+        if response.status_code == 403:
+            results.log_pass("Report blob - other district denied")
+        else:
+            results.log_fail("Report blob - other district denied", f"Expected 403, got {response.status_code}")
+    except Exception as e:
+        results.log_fail("Report blob - other district denied", f"Request error: {str(e)}")
+
+def test_job_stats_access():
+    """Test that background job metrics are restricted to district officials"""
+    expected = {'district_official': 200, 'cooperative_leader': 403, 'member': 403}
+    for role, expected_status in expected.items():
+        if role not in tokens:
+            continue
+            
+        try:
+            headers = {'Authorization': f'Bearer {tokens[role]}'}
+            response = requests.get(
+                f"{API_BASE}/jobs",
+                headers=headers,
+                timeout=10
+            )
+            
+            if response.status_code != expected_status:
+                results.log_fail(f"Job stats access - {role}", f"Expected {expected_status}, got {response.status_code}")
+            elif expected_status == 200 and not isinstance(response.json(), list):
+                results.log_fail(f"Job stats access - {role}", "Response is not a list")
+            else:
+                results.log_pass(f"Job stats access - {role}")
+        except Exception as e:
+            results.log_fail(f"Job stats access - {role}", f"Request error: {str(e)}")
+
 def test_data_validation():
     """Test data validation for various endpoints"""
     if 'cooperative_leader' not in tokens:
@@ -424,16 +734,111 @@ def test_data_validation():
     except Exception as e:
         results.log_fail("Required fields validation", f"Request error: {str(e)}")
 
+def load_server():
+    """Import backend/server.py for checks that do not need a running server"""
+    if BACKEND_DIR not in sys.path:
+        sys.path.insert(0, BACKEND_DIR)
+    import server
+    return server
+
+def test_cron_trigger():
+    """Test cron next-run computation without a server"""
+    server = load_server()
+    cases = [
+        ("step", "*/15 * * * *", datetime(2026, 10, 19, 10, 7), datetime(2026, 10, 19, 10, 15)),
+        ("list", "5,35 * * * *", datetime(2026, 10, 19, 10, 36), datetime(2026, 10, 19, 11, 5)),
+        ("range", "0 9-17 * * *", datetime(2026, 10, 19, 17, 30), datetime(2026, 10, 20, 9, 0)),
+        # 2026-10-19 is a Monday; the Friday comes before the 13th of November
+        ("day or weekday", "0 0 13 * 5", datetime(2026, 10, 19), datetime(2026, 10, 23)),
+        ("weekday only", "30 8 * * 0", datetime(2026, 10, 19), datetime(2026, 10, 25, 8, 30)),
+        ("Feb 29", "0 0 29 2 *", datetime(2026, 10, 19), datetime(2028, 2, 29)),
+        ("month rollover", "0 0 1 * *", datetime(2026, 1, 31, 12, 0), datetime(2026, 2, 1)),
+        ("year rollover", "59 23 31 12 *", datetime(2026, 12, 31, 23, 59), datetime(2027, 12, 31, 23, 59)),
+    ]
+    for label, expression, after, expected in cases:
+        try:
+            result = server.CronTrigger(expression).next_run(after)
+            if result == expected:
+                results.log_pass(f"Cron trigger - {label}")
+            else:
+                results.log_fail(f"Cron trigger - {label}", f"Expected {expected}, got {result}")
+        except Exception as e:
+            results.log_fail(f"Cron trigger - {label}", f"Error: {str(e)}")
+    
+    try:
+        server.CronTrigger("0 0 30 2 *").next_run(datetime(2026, 10, 19))
+        results.log_fail("Cron trigger - never fires", "Expected ValueError")
+    except ValueError:
+        results.log_pass("Cron trigger - never fires")
+
+class FakeLeaseCollection:
+    """Mimics the job_leases upsert: a held lease makes the insert collide on _id"""
+    
+    def __init__(self):
+        self.docs = {}
+    
+    async def find_one_and_update(self, filter, update, upsert=False, return_document=None):
+        from pymongo.errors import DuplicateKeyError
+        doc = self.docs.get(filter['_id'])
+        expired, owned = filter['$or']
+        if doc is None or doc['expires_at'] <= expired['expires_at']['$lte'] or doc['owner'] == owned['owner']:
+            self.docs[filter['_id']] = {'_id': filter['_id'], **update['$set']}
+            return self.docs[filter['_id']]
+        if upsert:
+            raise DuplicateKeyError("E11000 duplicate key error")
+        return None
+
+class FakeLeaseDB:
+    def __init__(self):
+        self.job_leases = FakeLeaseCollection()
+
+def test_job_lease():
+    """Test that only one worker holds a job lease at a time, without a server"""
+    server = load_server()
+    original_db = server.db
+    server.db = FakeLeaseDB()
+    first = server.JobScheduler('worker-1')
+    second = server.JobScheduler('worker-2')
+    later = datetime.utcnow() + timedelta(minutes=5)
+    try:
+        checks = [
+            ("first worker acquires", first, later, True),
+            ("second worker blocked", second, later, False),
+            ("holder renews", first, later, True),
+        ]
+        for label, scheduler, until, expected in checks:
+            acquired = asyncio.run(scheduler.acquire_lease('report', until))
+            if acquired == expected:
+                results.log_pass(f"Job lease - {label}")
+            else:
+                results.log_fail(f"Job lease - {label}", f"Expected {expected}, got {acquired}")
+        
+        # Once the lease has expired another worker may take it
+        server.db.job_leases.docs['report']['expires_at'] = datetime.utcnow() - timedelta(seconds=1)
+        if asyncio.run(second.acquire_lease('report', later)):
+            results.log_pass("Job lease - expired lease taken over")
+        else:
+            results.log_fail("Job lease - expired lease taken over", "Second worker could not acquire")
+    except Exception as e:
+        results.log_fail("Job lease", f"Error: {str(e)}")
+    finally:
+        server.db = original_db
+
 def run_all_tests():
     """Run all backend tests in sequence"""
     print("🚀 Starting Rwanda District Cooperative Management System Backend Tests")
     print(f"Testing against: {API_BASE}")
     print("="*60)
     
+    # Scheduler checks (no server needed)
+    test_cron_trigger()
+    test_job_lease()
+    
     # Basic connectivity and health
     if not test_health_check():
         print("❌ Health check failed - stopping tests")
         return False
+    test_readiness_check()
     
     # Authentication tests
     test_user_registration()
@@ -446,8 +851,18 @@ def run_all_tests():
     # Cooperative management tests
     test_cooperative_creation()
     test_cooperative_listing()
+    test_cooperative_detail()
+    test_cooperative_sparse_fields()
+    test_response_compression()
     test_cooperative_approval()
     
+    # Reporting tests
+    test_district_report()
+    test_report_blob_requests()
+    
+    # Background job tests
+    test_job_stats_access()
+    
     # Data validation tests
     test_data_validation()
     